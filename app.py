@@ -1,89 +1,186 @@
-import random
+import atexit
 import time
 import sqlite3
+import threading
+import numpy as np
 import streamlit as st
 
+from kernels import HAVE_NUMBA, branchless_binary_search, interpolation_search
+
+# Number of buffered search logs that triggers a batched write
+LOG_FLUSH_THRESHOLD = 32
+# Seconds a buffered search log may wait before it is written
+LOG_FLUSH_INTERVAL = 5.0
+
+DB_PATH = 'search_performance.db'
+# Seconds a connection waits on a locked database before raising
+DB_BUSY_TIMEOUT = 10.0
+
+# Open a connection with the per-connection pragmas (NORMAL sync avoids an fsync on
+# every commit under WAL)
+def connect_db():
+    # Streamlit may run reruns on different threads, so the connection must be shareable
+    conn = sqlite3.connect(DB_PATH, timeout=DB_BUSY_TIMEOUT, check_same_thread=False)
+    conn.executescript('''
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;''')
+    return conn
+
 # Set up the SQLite database connection
 def setup_database():
-    conn = sqlite3.connect('search_performance.db')
-    cursor = conn.cursor()
-    cursor.execute('''CREATE TABLE IF NOT EXISTS search_stats (
-                        id INTEGER PRIMARY KEY,
-                        method TEXT,
-                        target INTEGER,
-                        list_length INTEGER,
-                        time_taken REAL)''')
-    conn.commit()
-    return conn, cursor
-
-# Naive search: scans the entire list for the target
+    conn = connect_db()
+    # One script: switch the database to WAL, then the schema and the covering index for
+    # the per-method summary in a single transaction
+    conn.executescript('''
+        PRAGMA journal_mode=WAL;
+        BEGIN;
+        CREATE TABLE IF NOT EXISTS search_stats (
+            id INTEGER PRIMARY KEY,
+            method TEXT,
+            target INTEGER,
+            list_length INTEGER,
+            time_taken REAL);
+        CREATE INDEX IF NOT EXISTS idx_search_stats_method ON search_stats (method, time_taken);
+        COMMIT;''')
+    return conn
+
+# One database connection per session, reused across reruns
+def get_conn():
+    if "conn" not in st.session_state:
+        st.session_state["conn"] = setup_database()
+    return st.session_state["conn"]
+
+# Naive search: scans the entire array for the target (vectorized compare)
 def naive_search(l, target):
-    for i in range(len(l)):
-        if l[i] == target:
-            return i
-    return -1
-
-# Binary search: efficient search leveraging the sorted property of the list
-def binary_search(l, target, low=None, high=None):
-    if low is None:
-        low = 0
-    if high is None:
-        high = len(l) - 1
-
-    if high < low:
-        return -1
-
-    midpoint = (low + high) // 2
-
-    if l[midpoint] == target:
-        return midpoint
-    elif target < l[midpoint]:
-        return binary_search(l, target, low, midpoint-1)
-    else:
-        return binary_search(l, target, midpoint+1, high)
-
-# Function to log search statistics to SQLite
+    idx = np.flatnonzero(l == target)
+    return int(idx[0]) if idx.size else -1
+
+# Binary search without Numba: searchsorted runs the search loop in C over the raw array
+def binary_search(arr, target):
+    i = int(np.searchsorted(arr, target))
+    return i if i < len(arr) and arr[i] == target else -1
+
+# Generate the sorted search array once per list length; cache_resource hands back the
+# same contiguous array on every rerun instead of unpickling a fresh copy like cache_data
+@st.cache_resource
+def make_sorted_list(length, seed=0):
+    rng = np.random.default_rng(seed)
+    arr = np.sort(rng.choice(6*length, size=length, replace=False).astype(np.int64) - 3*length)
+    arr.setflags(write=False)
+    return arr
+
+# Write buffered search logs in a single transaction
+def flush_search_stats(conn, buffer):
+    with buffer["lock"]:
+        if buffer["timer"] is not None:
+            buffer["timer"].cancel()
+            buffer["timer"] = None
+        if not buffer["rows"]:
+            return
+        with conn:
+            conn.executemany("INSERT INTO search_stats (method, target, list_length, time_taken) VALUES (?, ?, ?, ?)",
+                             buffer["rows"])
+        buffer["rows"].clear()
+
+# Flush on a short-lived connection, for the flush timer and interpreter exit
+def _flush_on_own_connection(buffer):
+    conn = connect_db()
+    try:
+        flush_search_stats(conn, buffer)
+    finally:
+        conn.close()
+
+# Process-wide buffer of search logs not yet written to SQLite, shared by all sessions
+@st.cache_resource
+def get_log_buffer():
+    buffer = {"rows": [], "timer": None, "lock": threading.Lock()}
+    atexit.register(_flush_on_own_connection, buffer)
+    return buffer
+
+# Function to log search statistics to SQLite (buffered, flushed in batches or after
+# LOG_FLUSH_INTERVAL seconds, whichever comes first)
 def log_search_stats(cursor, method, target, list_length, time_taken):
-    cursor.execute("INSERT INTO search_stats (method, target, list_length, time_taken) VALUES (?, ?, ?, ?)", 
-                   (method, target, list_length, time_taken))
-    cursor.connection.commit()
+    buffer = get_log_buffer()
+    with buffer["lock"]:
+        buffer["rows"].append((method, target, list_length, time_taken))
+        full = len(buffer["rows"]) >= LOG_FLUSH_THRESHOLD
+        if not full and buffer["timer"] is None:
+            timer = threading.Timer(LOG_FLUSH_INTERVAL, _flush_on_own_connection, (buffer,))
+            timer.daemon = True
+            buffer["timer"] = timer
+            timer.start()
+    if full:
+        flush_search_stats(cursor.connection, buffer)
+
+# Per-method totals from SQLite; last_id keys the cache so it refreshes only after new rows land
+@st.cache_data(ttl=5)
+def fetch_method_totals(_cursor, last_id):
+    _cursor.execute("SELECT method, SUM(time_taken) as total_time, COUNT(*) as num_searches FROM search_stats GROUP BY method")
+    return _cursor.fetchall()
 
 # Function to display performance statistics from the SQLite database
 def display_performance_stats(cursor):
-    cursor.execute("SELECT method, AVG(time_taken) as avg_time, COUNT(*) as num_searches FROM search_stats GROUP BY method")
-    results = cursor.fetchall()
+    cursor.execute("SELECT MAX(id) FROM search_stats")
+    last_id = cursor.fetchone()[0]
+    totals = {method: [total_time, num_searches]
+              for method, total_time, num_searches in fetch_method_totals(cursor, last_id)}
+
+    # Include searches still waiting in the log buffer
+    buffer = get_log_buffer()
+    with buffer["lock"]:
+        pending = list(buffer["rows"])
+    for method, _, _, time_taken in pending:
+        entry = totals.setdefault(method, [0.0, 0])
+        entry[0] += time_taken
+        entry[1] += 1
+
     st.write("### Performance Summary")
-    for row in results:
-        st.write(f"Method: {row[0]}, Average Time: {row[1]:.6f} seconds, Number of Searches: {row[2]}")
+    for method, (total_time, num_searches) in totals.items():
+        st.write(f"Method: {method}, Average Time: {total_time / num_searches:.9f} seconds, Number of Searches: {num_searches}")
 
 # Streamlit app interface
 def main():
-    st.title("Search Algorithm Performance: Naive vs Binary Search")
+    st.title("Search Algorithm Performance: Naive vs Binary vs Interpolation Search")
     
     # Set up database
-    conn, cursor = setup_database()
+    cursor = get_conn().cursor()
 
     # User input for list length and target number
     length = st.slider("Choose List Length", 1000, 10000, 5000, step=1000)
     target = st.number_input("Enter Target Value", min_value=-3*length, max_value=3*length, value=100)
     
     # Generate sorted list
-    sorted_list = sorted(random.sample(range(-3*length, 3*length), length))
+    sorted_arr = make_sorted_list(length)
 
     # Radio buttons to select the search method
-    search_method = st.radio("Select Search Method", ("Naive Search", "Binary Search"))
+    # Without Numba interpolation search would time a Python loop against C searchsorted,
+    # so it is only offered when the JIT kernel is available
+    search_methods = ("Naive Search", "Binary Search") + (("Interpolation Search",) if HAVE_NUMBA else ())
+    search_method = st.radio("Select Search Method", search_methods)
 
     # Display and time the search based on selected method
     if st.button("Run Search"):
-        start_time = time.time()
         if search_method == "Naive Search":
-            naive_search(sorted_list, target)
+            search, search_target = naive_search, target
+        elif search_method == "Binary Search":
+            search = branchless_binary_search if HAVE_NUMBA else binary_search
+            search_target = np.int64(target)
         else:
-            binary_search(sorted_list, target)
-        end_time = time.time()
-        
-        time_taken = end_time - start_time
-        st.write(f"Search time: {time_taken:.6f} seconds")
+            search, search_target = interpolation_search, np.int64(target)
+
+        # Repeat the search so the timed region is well above clock resolution
+        reps = max(1, 200_000 // length)
+        start_cpu = time.thread_time_ns()
+        start_time = time.perf_counter_ns()
+        for _ in range(reps):
+            search(sorted_arr, search_target)
+        end_time = time.perf_counter_ns()
+        end_cpu = time.thread_time_ns()
+
+        time_taken = (end_time - start_time) / reps / 1e9
+        cpu_time = (end_cpu - start_cpu) / reps / 1e9
+        st.write(f"Search time: {time_taken:.9f} seconds (CPU: {cpu_time:.9f} seconds, averaged over {reps} runs)")
         
         # Log the search stats to the database
         log_search_stats(cursor, search_method, target, length, time_taken)
@@ -91,8 +188,5 @@ def main():
     # Display search performance statistics from the database
     display_performance_stats(cursor)
 
-    # Close the SQLite connection
-    conn.close()
-
 if __name__ == "__main__":
     main()
@@ -0,0 +1,52 @@
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    # Without Numba the JIT kernels below run as plain Python
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+
+# Binary search: branchless lower-bound over a sorted int64 array, JIT-compiled
+@njit(cache=True)
+def branchless_binary_search(arr, target):
+    n = arr.shape[0]
+    if n == 0:
+        return -1
+
+    # Narrow [base, base + n) to the last element <= target without a data-dependent branch
+    base = 0
+    while n > 1:
+        half = n >> 1
+        base += (arr[base + half] <= target) * half
+        n -= half
+    return base if arr[base] == target else -1
+
+# Interpolation search: probes where the target should sit in uniformly spread data, JIT-compiled
+@njit(cache=True)
+def interpolation_search(arr, target):
+    low = 0
+    high = arr.shape[0] - 1
+
+    while low <= high and arr[low] <= target <= arr[high]:
+        if arr[high] == arr[low]:
+            return low if arr[low] == target else -1
+        pos = low + (target - arr[low]) * (high - low) // (arr[high] - arr[low])
+        value = arr[pos]
+        if value == target:
+            return pos
+        elif value < target:
+            low = pos + 1
+        else:
+            high = pos - 1
+    return -1
+
+# Compile once per process at import, for the read-only arrays the app searches
+if HAVE_NUMBA:
+    _warm_up_arr = np.arange(4, dtype=np.int64)
+    _warm_up_arr.setflags(write=False)
+    branchless_binary_search(_warm_up_arr, np.int64(2))
+    interpolation_search(_warm_up_arr, np.int64(2))